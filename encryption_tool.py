@@ -6,12 +6,21 @@ Autokey, Vigenere, Playfair, Rail-Fence (keyless), Keyed Columnar,
 Combination (Keyed + Rail), Double Transposition, plus a CLI.
 """
 
+import os
 import string
-from itertools import cycle
-from math import ceil
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 
 ALPHABET = string.ascii_uppercase
 ALPHABET_SIZE = 26
+UPPER_A = ord('A')
+LOWER_A = ord('a')
+LOWER_Z = ord('z')
+# ASCII upper/lower case differ only in bit 0x20, so code point c is a letter when
+# LOWER_A <= (c | 0x20) <= LOWER_Z, and UPPER_A + (c & 0x20) is the base of its case.
+_LETTERS = frozenset(string.ascii_letters)
 
 
 def modinv(a, m):
@@ -31,22 +40,47 @@ def modinv(a, m):
     return inv
 
 
-def _shift_char(ch, shift):
-    """Shift single character preserving case; shift may be negative."""
-    if ch.isalpha():
-        base = ord('A') if ch.isupper() else ord('a')
-        return chr((ord(ch) - base + shift) % ALPHABET_SIZE + base)
-    return ch
+def _alphabet_index(ch):
+    return (ord(ch) | 0x20) - LOWER_A
 
 
-def _alphabet_index(ch):
-    return ord(ch.upper()) - ord('A')
+def _affine_table(a, b):
+    """Return a str.translate table mapping letter x to (a*x + b) mod 26, preserving case.
+       Additive (a=1) and multiplicative (b=0) are special cases; non-letters map to themselves."""
+    return _affine_table_mod(a % ALPHABET_SIZE, b % ALPHABET_SIZE)
+
+
+@lru_cache(maxsize=None)
+def _affine_table_mod(a, b):
+    """Build the _affine_table for reduced a, b; at most 26*26 distinct tables exist."""
+    mapped = ''.join(ALPHABET[(a * x + b) % ALPHABET_SIZE] for x in range(ALPHABET_SIZE))
+    return str.maketrans(ALPHABET + ALPHABET.lower(), mapped + mapped.lower())
+
+
+@lru_cache(maxsize=64)
+def _key_shifts(keyword):
+    """Return the key schedule of keyword: shift values of its ASCII letters, all else skipped."""
+    return tuple(_alphabet_index(k) for k in keyword if k in _LETTERS)
+
+
+def _split_letters(text):
+    """Return (positions, letters) for the ASCII letters of text."""
+    positions = [i for i, ch in enumerate(text) if ch in _LETTERS]
+    return positions, ''.join([text[i] for i in positions])
+
+
+def _merge_letters(text, positions, letters):
+    """Write letters back into text at positions, leaving every other character untouched."""
+    result = list(text)
+    for i, ch in zip(positions, letters):
+        result[i] = ch
+    return ''.join(result)
 
 
 # ----------------- ADDITIVE CIPHER (Caesar) -----------------
 def additive_encrypt(plaintext, key):
     """Encrypt plaintext using Additive (Caesar) Cipher"""
-    return ''.join(_shift_char(ch, key) for ch in plaintext)
+    return plaintext.translate(_affine_table(1, key))
 
 
 def additive_decrypt(ciphertext, key):
@@ -57,14 +91,7 @@ def additive_decrypt(ciphertext, key):
 # ----------------- MULTIPLICATIVE CIPHER -----------------
 def multiplicative_encrypt(plaintext, key):
     """Encrypt using Multiplicative Cipher"""
-    result = []
-    for ch in plaintext:
-        if ch.isalpha():
-            base = ord('A') if ch.isupper() else ord('a')
-            result.append(chr(((ord(ch) - base) * key) % ALPHABET_SIZE + base))
-        else:
-            result.append(ch)
-    return ''.join(result)
+    return plaintext.translate(_affine_table(key, 0))
 
 
 def multiplicative_decrypt(ciphertext, key):
@@ -78,15 +105,7 @@ def multiplicative_decrypt(ciphertext, key):
 # ----------------- AFFINE CIPHER -----------------
 def affine_encrypt(plaintext, a, b):
     """Encrypt using Affine Cipher: E(x) = (a*x + b) mod 26"""
-    result = []
-    for ch in plaintext:
-        if ch.isalpha():
-            base = ord('A') if ch.isupper() else ord('a')
-            x = ord(ch) - base
-            result.append(chr((a * x + b) % ALPHABET_SIZE + base))
-        else:
-            result.append(ch)
-    return ''.join(result)
+    return plaintext.translate(_affine_table(a, b))
 
 
 def affine_decrypt(ciphertext, a, b):
@@ -94,76 +113,59 @@ def affine_decrypt(ciphertext, a, b):
     inv = modinv(a, ALPHABET_SIZE)
     if inv is None:
         return "Invalid key! 'a' not invertible mod 26"
-    result = []
-    for ch in ciphertext:
-        if ch.isalpha():
-            base = ord('A') if ch.isupper() else ord('a')
-            y = ord(ch) - base
-            result.append(chr((inv * (y - b)) % ALPHABET_SIZE + base))
-        else:
-            result.append(ch)
-    return ''.join(result)
+    # a_inv*(y - b) == a_inv*y - a_inv*b, so decryption is itself an affine map
+    return ciphertext.translate(_affine_table(inv, -inv * b))
 
 
 # ----------------- MONOALPHABETIC SUBSTITUTION -----------------
 def _validate_mono_key(key):
+    """Return True if key is a permutation of A-Z (either case), tracked as a 26-bit mask."""
     if len(key) != 26:
         return False
-    up = key.upper()
-    return set(up) == set(ALPHABET)
+    mask = 0
+    for ch in key:
+        c = ord(ch) | 0x20
+        if not LOWER_A <= c <= LOWER_Z:
+            return False
+        mask |= 1 << (c - LOWER_A)
+    return mask == 0x3FFFFFF
+
+
+def _mono_table(source, target):
+    """Return a str.translate table mapping source letters to target letters in both cases."""
+    return str.maketrans(source + source.lower(), target + target.lower())
 
 
 def monoalphabetic_encrypt(plaintext, key):
     """Encrypt using Monoalphabetic Substitution Cipher"""
     if not _validate_mono_key(key):
         raise ValueError("Key must be 26 unique letters A-Z")
-    key_map = {ALPHABET[i]: key.upper()[i] for i in range(26)}
-    result = []
-    for ch in plaintext:
-        if ch.isupper():
-            result.append(key_map.get(ch, ch))
-        elif ch.islower():
-            result.append(key_map.get(ch.upper(), ch).lower())
-        else:
-            result.append(ch)
-    return ''.join(result)
+    return plaintext.translate(_mono_table(ALPHABET, key.upper()))
 
 
 def monoalphabetic_decrypt(ciphertext, key):
     """Decrypt Monoalphabetic Cipher"""
     if not _validate_mono_key(key):
         raise ValueError("Key must be 26 unique letters A-Z")
-    inv_map = {key.upper()[i]: ALPHABET[i] for i in range(26)}
-    result = []
-    for ch in ciphertext:
-        if ch.isupper():
-            result.append(inv_map.get(ch, ch))
-        elif ch.islower():
-            result.append(inv_map.get(ch.upper(), ch).lower())
-        else:
-            result.append(ch)
-    return ''.join(result)
+    # swapping source and target inverts the mapping
+    return ciphertext.translate(_mono_table(key.upper(), ALPHABET))
 
 
 # ----------------- AUTOKEY CIPHER -----------------
 def autokey_encrypt(plaintext, keyword):
     """Encrypt using Autokey Cipher: key = keyword + plaintext (letters only)"""
-    key_stream = []
-    # Build key stream using letters only from keyword and plaintext
-    for ch in keyword:
-        if ch.isalpha():
-            key_stream.append(ch.upper())
-    for ch in plaintext:
-        if ch.isalpha():
-            key_stream.append(ch.upper())
+    # The key for letter k is keyword letter k, then plaintext letter k - len(keyword), so
+    # only the next len(keyword) shifts are ever pending; a FIFO holds just those.
+    pending = deque(_key_shifts(keyword))
     result = []
-    ks_index = 0
     for ch in plaintext:
-        if ch.isalpha():
-            base = ord('A') if ch.isupper() else ord('a')
-            k = ord(key_stream[ks_index]) - ord('A')
-            result.append(chr((ord(ch) - base + k) % ALPHABET_SIZE + base))
-            ks_index += 1
+        c = ord(ch)
+        if LOWER_A <= (c | 0x20) <= LOWER_Z:
+            base = UPPER_A + (c & 0x20)
+            x = c - base
+            # push before popping: with an empty keyword a letter is keyed by itself
+            pending.append(x)
+            result.append(chr((x + pending.popleft()) % ALPHABET_SIZE + base))
         else:
             result.append(ch)
     return ''.join(result)
@@ -171,17 +173,17 @@ def autokey_encrypt(plaintext, keyword):
 
 def autokey_decrypt(ciphertext, keyword):
     """Decrypt Autokey Cipher"""
+    key_stream = list(_key_shifts(keyword))
     result = []
-    key_stream = [c.upper() for c in keyword if c.isalpha()]
     ks_index = 0
     for ch in ciphertext:
-        if ch.isalpha():
-            base = ord('A') if ch.isupper() else ord('a')
-            k = ord(key_stream[ks_index]) - ord('A')
-            plain_ch = chr((ord(ch) - base - k) % ALPHABET_SIZE + base)
-            result.append(plain_ch)
-            # append the decrypted letter (uppercase) to key stream for future letters
-            key_stream.append(plain_ch.upper())
+        c = ord(ch)
+        if LOWER_A <= (c | 0x20) <= LOWER_Z:
+            base = UPPER_A + (c & 0x20)
+            x = (c - base - key_stream[ks_index]) % ALPHABET_SIZE
+            result.append(chr(x + base))
+            # the decrypted letter extends the key stream for future letters
+            key_stream.append(x)
             ks_index += 1
         else:
             result.append(ch)
@@ -189,34 +191,53 @@ def autokey_decrypt(ciphertext, keyword):
 
 
 # ----------------- VIGENERE CIPHER -----------------
-def vigenere_encrypt(plaintext, keyword):
-    """Encrypt using Vigenere Cipher"""
+_VIGENERE_TRANSLATE_MIN = 1024  # text length from which per-position translate tables pay off
+
+
+def _vigenere_tables(keyword, sign):
+    """Return one translate table per key letter, specialised to keyword and direction.
+       Shifts and tables are each cached already, so this only assembles the tuple."""
+    return tuple(_affine_table(1, sign * k_val) for k_val in _key_shifts(keyword))
+
+
+def _vigenere_apply(text, keyword, sign):
+    """Shift the letters of text by the repeating keyword (sign=+1 encrypt, -1 decrypt)."""
+    shifts = _key_shifts(keyword)
+    if not shifts:
+        raise ValueError("Key must contain alphabetic characters")
+    period = len(shifts)
+    if len(text) >= _VIGENERE_TRANSLATE_MIN:
+        # Letters sharing a key position use the same shift, so each group is one translate()
+        tables = _vigenere_tables(keyword, sign)
+        positions, letters = _split_letters(text)
+        out = list(letters)
+        for j, table in enumerate(tables):
+            out[j::period] = letters[j::period].translate(table)
+        return _merge_letters(text, positions, out)
+    # short text: building the tables costs more than a single shifting pass
     result = []
-    key_iter = (k for k in cycle(keyword) if k.isalpha())
-    for ch in plaintext:
-        if ch.isalpha():
-            k = next(key_iter)
-            base = ord('A') if ch.isupper() else ord('a')
-            k_val = ord(k.upper()) - ord('A')
-            result.append(chr((ord(ch) - base + k_val) % ALPHABET_SIZE + base))
+    j = 0
+    for ch in text:
+        c = ord(ch)
+        if LOWER_A <= (c | 0x20) <= LOWER_Z:
+            base = UPPER_A + (c & 0x20)
+            result.append(chr((c - base + sign * shifts[j]) % ALPHABET_SIZE + base))
+            j += 1
+            if j == period:
+                j = 0
         else:
             result.append(ch)
     return ''.join(result)
 
 
+def vigenere_encrypt(plaintext, keyword):
+    """Encrypt using Vigenere Cipher"""
+    return _vigenere_apply(plaintext, keyword, 1)
+
+
 def vigenere_decrypt(ciphertext, keyword):
     """Decrypt Vigenere Cipher"""
-    result = []
-    key_iter = (k for k in cycle(keyword) if k.isalpha())
-    for ch in ciphertext:
-        if ch.isalpha():
-            k = next(key_iter)
-            base = ord('A') if ch.isupper() else ord('a')
-            k_val = ord(k.upper()) - ord('A')
-            result.append(chr((ord(ch) - base - k_val) % ALPHABET_SIZE + base))
-        else:
-            result.append(ch)
-    return ''.join(result)
+    return _vigenere_apply(ciphertext, keyword, -1)
 
 
 # ----------------- PLAYFAIR CIPHER -----------------
@@ -245,25 +266,38 @@ def _playfair_prepare_text(text, filler='X'):
     return out
 
 
+@lru_cache(maxsize=32)
 def _playfair_key_square(keyword):
-    """Return 5x5 key square (list of lists) and mapping from letter to (r,c). J merged with I."""
+    """Return 5x5 key square (tuple of row tuples) and mapping from letter to (r,c).
+       J merged with I. Cached per keyword; callers must not mutate the returned mapping."""
     seen = []
-    for c in keyword.upper():
+    seen_set = set()
+    for c in keyword.upper() + ALPHABET:
         if not c.isalpha():
             continue
         ch = 'I' if c == 'J' else c
-        if ch not in seen:
-            seen.append(ch)
-    for c in ALPHABET:
-        ch = 'I' if c == 'J' else c
-        if ch not in seen:
+        if ch not in seen_set:
+            seen_set.add(ch)
             seen.append(ch)
     # build 5x5
-    square = [seen[i * 5:(i + 1) * 5] for i in range(5)]
+    square = tuple(tuple(seen[i * 5:(i + 1) * 5]) for i in range(5))
     pos = {square[r][c]: (r, c) for r in range(5) for c in range(5)}
     return square, pos
 
 
+def _playfair_restore_case(text, letters):
+    """Map letters onto the pattern of text, preserving case and non-alpha characters."""
+    result = []
+    alpha_iter = iter(letters)
+    for ch in text:
+        if ch.isalpha():
+            out = next(alpha_iter)
+            result.append(out if ch.isupper() else out.lower())
+        else:
+            result.append(ch)
+    return ''.join(result)
+
+
 def playfair_encrypt(plaintext, keyword):
     """Playfair encryption (classic 5x5)"""
     square, pos = _playfair_key_square(keyword)
@@ -285,16 +319,7 @@ def playfair_encrypt(plaintext, keyword):
             # rectangle -> swap columns
             cipher.append(square[ra][cb])
             cipher.append(square[rb][ca])
-    # preserve case by mapping onto original plaintext pattern
-    result = []
-    alpha_iter = iter(cipher)
-    for ch in plaintext:
-        if ch.isalpha():
-            out = next(alpha_iter)
-            result.append(out if ch.isupper() else out.lower())
-        else:
-            result.append(ch)
-    return ''.join(result)
+    return _playfair_restore_case(plaintext, cipher)
 
 
 def playfair_decrypt(ciphertext, keyword):
@@ -314,77 +339,60 @@ def playfair_decrypt(ciphertext, keyword):
         else:
             plain.append(square[ra][cb])
             plain.append(square[rb][ca])
-    # Map decrypted letters onto original ciphertext pattern to preserve case and non-alpha
-    result = []
-    alpha_iter = iter(plain)
-    for ch in ciphertext:
-        if ch.isalpha():
-            out = next(alpha_iter)
-            result.append(out if ch.isupper() else out.lower())
-        else:
-            result.append(ch)
-    return ''.join(result)
+    return _playfair_restore_case(ciphertext, plain)
 
 
 # ----------------- KEYLESS TRANSPOSITION (Rail-Fence) -----------------
+def _rail_pattern(n, depth):
+    """Return the zig-zag rail index for each of n positions (depth >= 2)."""
+    period = 2 * (depth - 1)
+    return [pos if pos < depth else period - pos for pos in (i % period for i in range(n))]
+
+
 def rail_fence_encrypt(plaintext, depth=3):
     """Simple rail-fence: build rails and then concatenate them."""
     if depth <= 1:
         return plaintext
-    rails = ['' for _ in range(depth)]
-    rail = 0
-    direction = 1  # 1 down, -1 up
-    for ch in plaintext:
-        rails[rail] += ch
-        # move rail pointer for every character (includes non-alpha to preserve positions)
-        rail += direction
-        if rail == depth - 1:
-            direction = -1
-        elif rail == 0:
-            direction = 1
-    return ''.join(rails)
+    rails = [[] for _ in range(depth)]
+    # every character moves the rail pointer (includes non-alpha to preserve positions)
+    for ch, r in zip(plaintext, _rail_pattern(len(plaintext), depth)):
+        rails[r].append(ch)
+    return ''.join(''.join(rail) for rail in rails)
 
 
 def rail_fence_decrypt(ciphertext, depth=3):
     if depth <= 1:
         return ciphertext
-    n = len(ciphertext)
-    # build pattern
-    pattern = [None] * n
-    rail = 0
-    direction = 1
-    for i in range(n):
-        pattern[i] = rail
-        rail += direction
-        if rail == depth - 1:
-            direction = -1
-        elif rail == 0:
-            direction = 1
-    # count how many chars in each rail
-    counts = [pattern.count(r) for r in range(depth)]
-    rails = []
-    idx = 0
-    for c in counts:
-        rails.append(list(ciphertext[idx:idx + c]))
-        idx += c
-    # reconstruct
+    pattern = _rail_pattern(len(ciphertext), depth)
+    counts = [0] * depth
+    for r in pattern:
+        counts[r] += 1
+    # each rail is a contiguous slice of the ciphertext; read it with a cursor
+    cursors = [0] * depth
+    for r in range(1, depth):
+        cursors[r] = cursors[r - 1] + counts[r - 1]
     result = []
     for r in pattern:
-        result.append(rails[r].pop(0))
+        result.append(ciphertext[cursors[r]])
+        cursors[r] += 1
     return ''.join(result)
 
 
 # ----------------- KEYED TRANSPOSITION (Columnar) -----------------
 def _column_order_from_key(key):
-    """Return order of columns by sorting key letters; repeated letters handled left-to-right."""
+    """Return (order, inv_order) of columns by sorting key letters; repeated letters handled
+       left-to-right. order[col] is the read position of col, inv_order[pos] the column
+       read at pos."""
     key_letters = [c for c in key if c.isalpha()]
     enumerated = list(enumerate(key_letters))
     # sort by letter then by original index to make ordering stable for duplicates
     sorted_enum = sorted(enumerated, key=lambda x: (x[1].upper(), x[0]))
     order = [None] * len(key_letters)
+    inv_order = [None] * len(key_letters)
     for new_pos, (orig_index, _) in enumerate(sorted_enum):
         order[orig_index] = new_pos
-    return order
+        inv_order[new_pos] = orig_index
+    return order, inv_order
 
 
 def keyed_columnar_encrypt(plaintext, key):
@@ -393,58 +401,27 @@ def keyed_columnar_encrypt(plaintext, key):
     cols = len([c for c in key if c.isalpha()])
     if cols == 0:
         raise ValueError("Key must contain alphabetic characters")
-    # build matrix row-wise including all characters (so non-alpha included)
-    rows = ceil(len(plaintext) / cols)
-    matrix = [['' for _ in range(cols)] for _ in range(rows)]
-    idx = 0
-    for r in range(rows):
-        for c in range(cols):
-            if idx < len(plaintext):
-                matrix[r][c] = plaintext[idx]
-                idx += 1
-            else:
-                matrix[r][c] = ''
-    order = _column_order_from_key(key)
+    _, inv_order = _column_order_from_key(key)
+    # text is laid out row-wise (non-alpha included), so column c is the slice plaintext[c::cols];
     # read columns in increasing order index
-    result = []
-    for read_pos in range(cols):
-        # find which original column has order == read_pos
-        orig_col = order.index(read_pos)
-        for r in range(rows):
-            if matrix[r][orig_col] != '':
-                result.append(matrix[r][orig_col])
-    return ''.join(result)
+    return ''.join(plaintext[orig_col::cols] for orig_col in inv_order)
 
 
 def keyed_columnar_decrypt(ciphertext, key):
     if len(key.strip()) == 0:
         raise ValueError("Key must be non-empty")
     cols = len([c for c in key if c.isalpha()])
-    rows = ceil(len(ciphertext) / cols)
-    order = _column_order_from_key(key)
-    # determine number of full cells in each column
-    base = len(ciphertext) // cols
-    extra = len(ciphertext) % cols
-    col_counts = []
-    # columns will be filled in sorted order
-    for read_pos in range(cols):
-        orig_col = order.index(read_pos)
-        cnt = base + (1 if orig_col < extra else 0)
-        col_counts.append((orig_col, cnt))
-    # Create empty column lists
-    columns = {i: [] for i in range(cols)}
+    _, inv_order = _column_order_from_key(key)
+    n = len(ciphertext)
+    # every column holds base cells; the first extra columns hold one more
+    base, extra = divmod(n, cols)
+    result = [''] * n
     idx = 0
-    # Fill columns by reading ciphertext sequentially according to sorted order
-    for read_pos in range(cols):
-        orig_col, cnt = col_counts[read_pos]
-        columns[orig_col] = list(ciphertext[idx:idx + cnt])
+    # each ciphertext run is one column; column c occupies positions c, c+cols, ... of the text
+    for orig_col in inv_order:
+        cnt = base + (1 if orig_col < extra else 0)
+        result[orig_col::cols] = ciphertext[idx:idx + cnt]
         idx += cnt
-    # Reconstruct row-wise
-    result = []
-    for r in range(rows):
-        for c in range(cols):
-            if columns[c]:
-                result.append(columns[c].pop(0))
     return ''.join(result)
 
 
@@ -470,6 +447,52 @@ def double_transposition_decrypt(ciphertext, key1, key2):
     return second
 
 
+# ----------------- BATCH ENCRYPTION -----------------
+_BATCH_CIPHERS = {
+    'additive': additive_encrypt,
+    'multiplicative': multiplicative_encrypt,
+    'affine': affine_encrypt,
+    'monoalphabetic': monoalphabetic_encrypt,
+    'autokey': autokey_encrypt,
+    'vigenere': vigenere_encrypt,
+    'playfair': playfair_encrypt,
+    'rail_fence': rail_fence_encrypt,
+    'keyed_columnar': keyed_columnar_encrypt,
+    'combination': combination_transposition_encrypt,
+    'double': double_transposition_encrypt,
+}
+
+
+# Starting worker processes costs ~20ms, about what the pure-Python ciphers need for 100K chars,
+# so batches below this many characters in total are encrypted inline.
+_BATCH_PARALLEL_MIN_CHARS = 256 * 1024
+
+
+def encrypt_many(texts, key, cipher='vigenere', max_workers=None):
+    """Encrypt independent texts with the same key, spread across worker processes.
+       Ciphers taking several keys (affine, double) expect key as a tuple, e.g. (a, b).
+       Processes are used because the ciphers hold the GIL; batches totalling fewer than
+       _BATCH_PARALLEL_MIN_CHARS characters run inline in the calling process.
+       On platforms that start workers with spawn (Windows, macOS) the calling script must
+       guard its entry point with `if __name__ == "__main__":`, as for any process pool."""
+    try:
+        func = _BATCH_CIPHERS[cipher]
+    except KeyError:
+        raise ValueError(f"Unknown cipher: {cipher!r}") from None
+    if max_workers is not None and max_workers <= 0:
+        raise ValueError("max_workers must be greater than 0")
+    texts = list(texts)
+    keys = key if isinstance(key, tuple) else (key,)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    workers = min(max_workers, len(texts))
+    if workers <= 1 or sum(map(len, texts)) < _BATCH_PARALLEL_MIN_CHARS:
+        return [func(text, *keys) for text in texts]
+    chunksize = max(1, len(texts) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(func, texts, *(repeat(k) for k in keys), chunksize=chunksize))
+
+
 # ----------------- CLI -----------------
 def main():
     MENU = """
@@ -552,10 +575,13 @@ Encryption Tool - Select Cipher:
         elif choice == 6:
             keyword = input("Enter keyword: ").strip()
             mode = input("Encrypt(E) or Decrypt(D)? ").strip().upper()
-            if mode == 'E':
-                print("Result:", vigenere_encrypt(text, keyword))
-            else:
-                print("Result:", vigenere_decrypt(text, keyword))
+            try:
+                if mode == 'E':
+                    print("Result:", vigenere_encrypt(text, keyword))
+                else:
+                    print("Result:", vigenere_decrypt(text, keyword))
+            except ValueError as e:
+                print("Error:", e)
         elif choice == 7:
             keyword = input("Enter keyword: ").strip()
             mode = input("Encrypt(E) or Decrypt(D)? ").strip().upper()